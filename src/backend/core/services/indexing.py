@@ -5,7 +5,6 @@ import logging
 from django.conf import settings
 from django.core.exceptions import SuspiciousOperation
 
-from opensearchpy.exceptions import NotFoundError
 from py3langid.langid import MODEL_FILE, LanguageIdentifier
 
 from core.services.opensearch_configuration import (
@@ -27,22 +26,24 @@ LANGUAGE_IDENTIFIER.set_languages(["en", "fr", "de", "nl"])
 
 def ensure_index_exists(index_name):
     """Create index if it does not exist"""
-    try:
-        opensearch_client().indices.get(index=index_name)
-    except NotFoundError:
-        logger.info("Creating index: %s", index_name)
-        opensearch_client().indices.create(
-            index=index_name,
-            body={
-                "settings": {
-                    "analysis": {
-                        "analyzer": ANALYZERS,
-                        "filter": FILTERS,
-                    },
+    # A HEAD request is enough to know if the index exists, no need to fetch
+    # its whole settings and mappings.
+    if opensearch_client().indices.exists(index=index_name):
+        return
+
+    logger.info("Creating index: %s", index_name)
+    opensearch_client().indices.create(
+        index=index_name,
+        body={
+            "settings": {
+                "analysis": {
+                    "analyzer": ANALYZERS,
+                    "filter": FILTERS,
                 },
-                "mappings": MAPPINGS,
             },
-        )
+            "mappings": MAPPINGS,
+        },
+    )
 
 
 def prepare_document_for_indexing(document):
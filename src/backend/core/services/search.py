@@ -10,6 +10,12 @@ from .opensearch import opensearch_client
 
 logger = logging.getLogger(__name__)
 
+# Constant part of the search request body, built once and shared by all requests
+SCRIPT_FIELDS = {
+    "number_of_users": {"script": {"source": "doc['users'].size()"}},
+    "number_of_groups": {"script": {"source": "doc['groups'].size()"}},
+}
+
 
 # pylint: disable=too-many-arguments, too-many-positional-arguments
 def search(  # noqa : PLR0913
@@ -39,10 +45,7 @@ def search(  # noqa : PLR0913
         index=",".join(search_indices),
         body={
             "_source": enums.SOURCE_FIELDS,  # limit the fields to return
-            "script_fields": {
-                "number_of_users": {"script": {"source": "doc['users'].size()"}},
-                "number_of_groups": {"script": {"source": "doc['groups'].size()"}},
-            },
+            "script_fields": SCRIPT_FIELDS,
             "sort": get_sort(
                 order_by=order_by,
                 order_direction=order_direction,
@@ -9,6 +9,16 @@ from core.services import opensearch
 fake = Faker()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def opensearch_available():
+    """
+    Probe OpenSearch once for the whole session and stop the run with a failure when
+    it is not reachable, instead of having each test wait for a connection timeout.
+    """
+    if not opensearch.opensearch_client().ping(request_timeout=5):
+        pytest.exit("OpenSearch is not reachable", returncode=1)
+
+
 @pytest.fixture(autouse=True)
 def cleanup_test_index(settings):
     """
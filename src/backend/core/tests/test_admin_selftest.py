@@ -91,7 +91,7 @@ def test_selftest_displays_available_tests(client):
     assert b"Run All Tests" in response.content
 
 
-@patch("core.selftests.registry.run_all")
+@patch("core.selftests.registry.run_all", autospec=True)
 def test_selftest_runs_tests(mock_run_all, client):
     """Test that tests are executed when run=true."""
     selftest_url = reverse("admin:selftest")
@@ -128,7 +128,7 @@ def test_selftest_runs_tests(mock_run_all, client):
     mock_run_all.assert_called_once()
 
 
-@patch("core.selftests.registry.run_all")
+@patch("core.selftests.registry.run_all", autospec=True)
 def test_selftest_displays_success_status(mock_run_all, client):
     """Test that success status is displayed correctly."""
     selftest_url = reverse("admin:selftest")
@@ -155,7 +155,7 @@ def test_selftest_displays_success_status(mock_run_all, client):
     assert b"All tests passed successfully" in response.content
 
 
-@patch("core.selftests.registry.run_all")
+@patch("core.selftests.registry.run_all", autospec=True)
 def test_selftest_displays_failure_status(mock_run_all, client):
     """Test that failure status is displayed correctly."""
     selftest_url = reverse("admin:selftest")
@@ -14,6 +14,20 @@ from .utils import build_authorization_bearer, setup_oicd_resource_server
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture(name="resource_server")
+def resource_server_fixture(settings):
+    """Mock the resource server token introspection for the "user_sub" user."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mocked:
+        setup_oicd_resource_server(mocked, settings, sub="user_sub")
+        yield mocked
+
+
+@pytest.fixture(name="service")
+def service_fixture():
+    """Create the service whose index the documents are deleted from."""
+    return factories.ServiceFactory()
+
+
 def test_api_documents_delete_anonymous():
     """Anonymous requests should not be allowed to delete documents."""
     response = APIClient().post(
@@ -28,11 +42,9 @@ def test_api_documents_delete_anonymous():
     }
 
 
-@responses.activate
-def test_api_documents_delete_wrong_service_name(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_wrong_service_name():
     """Requests with a wrong service name should return 400 Bad Request."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-
     response = APIClient().post(
         "/api/v1.0/documents/delete/",
         {"service": "wrong-service", "document_ids": ["0"]},
@@ -44,12 +56,9 @@ def test_api_documents_delete_wrong_service_name(settings):
     assert response.json() == {"detail": "Invalid request."}
 
 
-@responses.activate
-def test_api_documents_delete_success(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_success(service):
     """Authenticated users should be able to delete documents they have access to."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-
-    service = factories.ServiceFactory()
     # Create documents user has access to
     documents = factories.DocumentSchemaFactory.build_batch(3, users=["user_sub"])
     prepare_index(service.index_name, documents)
@@ -75,11 +84,9 @@ def test_api_documents_delete_success(settings):
             assert doc["found"]
 
 
-@responses.activate
-def test_api_documents_delete_no_access(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_no_access(service):
     """Users should not be able to delete documents they don't have access to."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
     # Create documents where user_sub does NOT have access
     documents = factories.DocumentSchemaFactory.build_batch(2, users=["other_sub"])
     prepare_index(service.index_name, documents)
@@ -106,12 +113,9 @@ def test_api_documents_delete_no_access(settings):
         assert doc["found"]
 
 
-@responses.activate
-def test_api_documents_delete_mixed_access(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_mixed_access(service):
     """Deleting a mix of owned and non-owned documents should only delete owned ones."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-
-    service = factories.ServiceFactory()
     # Create documents with different access
     owned_documents = factories.DocumentSchemaFactory.build_batch(2, users=["user_sub"])
     other_documents = factories.DocumentSchemaFactory.build_batch(
@@ -152,11 +156,10 @@ def test_api_documents_delete_mixed_access(settings):
         assert document["found"]
 
 
-@responses.activate
-def test_api_documents_delete_missing_document_ids_and_tags(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_missing_document_ids_and_tags():
     """Requests missing both document_ids and tags should return 400."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
+    service = factories.ServiceFactory.build()
 
     response = APIClient().post(
         "/api/v1.0/documents/delete/",
@@ -175,11 +178,10 @@ def test_api_documents_delete_missing_document_ids_and_tags(settings):
     ]
 
 
-@responses.activate
-def test_api_documents_delete_empty_document_ids(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_empty_document_ids():
     """Requests with empty document_ids and no tags should return 400."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
+    service = factories.ServiceFactory.build()
 
     response = APIClient().post(
         "/api/v1.0/documents/delete/",
@@ -198,11 +200,10 @@ def test_api_documents_delete_empty_document_ids(settings):
     ]
 
 
-@responses.activate
-def test_api_documents_delete_both_filters_empty(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_both_filters_empty():
     """Requests with both document_ids and tags empty should return 400."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
+    service = factories.ServiceFactory.build()
 
     response = APIClient().post(
         "/api/v1.0/documents/delete/",
@@ -221,11 +222,9 @@ def test_api_documents_delete_both_filters_empty(settings):
     ]
 
 
-@responses.activate
-def test_api_documents_delete_missing_service(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_missing_service():
     """Requests missing the service field should return 400."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-
     response = APIClient().post(
         "/api/v1.0/documents/delete/",
         {"document_ids": ["doc1"]},
@@ -239,14 +238,12 @@ def test_api_documents_delete_missing_service(settings):
     ]
 
 
-@responses.activate
-def test_api_documents_delete_nonexistent_documents(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_nonexistent_documents(service):
     """
     Deleting non-existent documents should not raise an error
     and return the list of undeleted ids.
     """
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
     # Create index but with no documents
     prepare_index(service.index_name, [])
 
@@ -264,15 +261,12 @@ def test_api_documents_delete_nonexistent_documents(settings):
     }
 
 
-@responses.activate
+@pytest.mark.usefixtures("resource_server")
 @pytest.mark.flaky(
     reruns=2, reason="OpenSearch index race condition under high parallelism"
 )
-def test_api_documents_delete_by_single_tag(settings):
+def test_api_documents_delete_by_single_tag(service):
     """Users should be able to delete documents by tags."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
-
     document_to_deletes = [
         factories.DocumentSchemaFactory.build(
             users=["user_sub"], tags=["delete-tag", "keep-tag-1"]
@@ -312,12 +306,9 @@ def test_api_documents_delete_by_single_tag(settings):
         assert doc["found"]
 
 
-@responses.activate
-def test_api_documents_delete_by_multiple_tags(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_by_multiple_tags(service):
     """Users should be able to delete documents matching any of multiple tags."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
-
     document_to_deletes = [
         factories.DocumentSchemaFactory.build(
             users=["user_sub"], tags=["delete-tag-1", "keep-tag-1"]
@@ -360,12 +351,9 @@ def test_api_documents_delete_by_multiple_tags(settings):
         assert doc["found"]
 
 
-@responses.activate
-def test_api_documents_delete_by_ids_and_tags(settings):
+@pytest.mark.usefixtures("resource_server")
+def test_api_documents_delete_by_ids_and_tags(service):
     """Users should be able to delete documents by both IDs and tags (AND logic)."""
-    setup_oicd_resource_server(responses, settings, sub="user_sub")
-    service = factories.ServiceFactory()
-
     document_delete_by_tag_and_id = factories.DocumentSchemaFactory.build(
         users=["user_sub"], tags=["delete-tag"]
     )
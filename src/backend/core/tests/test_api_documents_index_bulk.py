@@ -89,6 +89,25 @@ def test_api_documents_index_bulk_ensure_index():
     opensearch_client_.indices.get(index=service.index_name)
 
 
+def test_api_documents_index_bulk_empty():
+    """Indexing an empty list of documents should not reach OpenSearch."""
+    service = factories.ServiceFactory()
+
+    response = APIClient().post(
+        "/api/v1.0/documents/index/",
+        [],
+        HTTP_AUTHORIZATION=f"Bearer {service.token:s}",
+        format="json",
+    )
+
+    assert response.status_code == 201
+    assert response.json() == []
+
+    # The index was not created
+    with pytest.raises(NotFoundError):
+        opensearch.opensearch_client().indices.get(index=service.index_name)
+
+
 @pytest.mark.parametrize(
     "field, invalid_value, error_type, error_message",
     [
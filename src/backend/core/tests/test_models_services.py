@@ -1,6 +1,6 @@
 """Tests Service model for find's core app."""
 
-from django.db import DataError, IntegrityError
+from django.db import DataError, IntegrityError, transaction
 
 import pytest
 
@@ -13,7 +13,7 @@ def test_models_services_name_unique():
     """The name field should be unique across services."""
     service = factories.ServiceFactory()
 
-    with pytest.raises(IntegrityError):
+    with pytest.raises(IntegrityError), transaction.atomic():
         factories.ServiceFactory(name=service.name)
 
 
@@ -30,13 +30,14 @@ def test_models_services_token_50_characters_exact():
     assert len(service.token) == 50
 
 
-def test_models_services_token_50_characters_less():
-    """The token field should not be less than 50 characters long."""
-    with pytest.raises(IntegrityError):
-        factories.ServiceFactory(token="a" * 49)
-
-
-def test_models_services_token_50_characters_more():
-    """The token field should be 50 characters long."""
-    with pytest.raises(DataError):
-        factories.ServiceFactory(token="a" * 51)
+@pytest.mark.parametrize(
+    "length, error",
+    [
+        (49, IntegrityError),
+        (51, DataError),
+    ],
+)
+def test_models_services_token_50_characters_invalid(length, error):
+    """The token field should not be less or more than 50 characters long."""
+    with pytest.raises(error), transaction.atomic():
+        factories.ServiceFactory(token="a" * length)
@@ -0,0 +1,54 @@
+"""Unit tests for the search service queries, with the OpenSearch search call mocked"""
+
+import logging
+from unittest import mock
+
+from core import enums
+from core.services.opensearch import opensearch_client
+from core.services.search import search
+
+SEARCH_PARAMS = {
+    "nb_results": 20,
+    "order_by": enums.RELEVANCE,
+    "order_direction": "desc",
+    "search_indices": ["find-service-1", "find-service-2"],
+    "reach": None,
+    "visited": [],
+    "user_sub": "user_sub",
+    "groups": [],
+    "tags": [],
+}
+
+
+def test_services_search_match_all(caplog):
+    """A "*" query should short-circuit to a match_all query."""
+    caplog.set_level(logging.INFO, logger="core.services.search")
+
+    with mock.patch.object(opensearch_client(), "search") as mock_search:
+        search(q="*", **SEARCH_PARAMS)
+
+    mock_search.assert_called_once()
+    kwargs = mock_search.call_args.kwargs
+    assert kwargs["index"] == "find-service-1,find-service-2"
+    assert kwargs["body"]["query"]["bool"]["must"] == {"match_all": {}}
+    assert "Performing match_all query" in caplog.messages
+
+
+def test_services_search_full_text(caplog, settings):
+    """Any other query should be a full-text query on titles and contents."""
+    caplog.set_level(logging.INFO, logger="core.services.search")
+
+    with mock.patch.object(opensearch_client(), "search") as mock_search:
+        search(q="canine pet", **SEARCH_PARAMS)
+
+    mock_search.assert_called_once()
+    should = mock_search.call_args.kwargs["body"]["query"]["bool"]["must"]["bool"][
+        "should"
+    ]
+    assert [clause["multi_match"]["query"] for clause in should] == [
+        "canine pet",
+        "canine pet",
+    ]
+    assert should[1]["multi_match"]["boost"] == settings.TRIGRAMS_BOOST
+    assert "Performing full-text search: canine pet" in caplog.messages
+    assert "Performing match_all query" not in caplog.messages
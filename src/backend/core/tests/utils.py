@@ -1,7 +1,6 @@
 """Utility functions for Test."""
 
 import base64
-import json
 import logging
 from functools import partial
 
@@ -31,7 +30,8 @@ def setup_oicd_resource_server(
     """
     Setup settings for a resource server.
     Simulate a token introspection.
-    NOTE : Use it with @responses.activate or the fake introspection view will not work.
+    NOTE : Use it with @responses.activate or pass a started `responses.RequestsMock`,
+    otherwise the fake introspection view will not work.
     """
     token_data = {
         "sub": sub,
@@ -68,5 +68,5 @@ def setup_oicd_resource_server(
         responses.add(
             responses.POST,
             settings.OIDC_OP_INTROSPECTION_ENDPOINT,
-            body=json.dumps(token_data),
+            json=token_data,
         )
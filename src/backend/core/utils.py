@@ -18,7 +18,7 @@ def prepare_index(index_name, documents: List):
     logger.info("Preparing index %s with %d documents", index_name, len(documents))
 
     ensure_index_exists(index_name)
-    actions = [
+    actions = (
         {
             "_op_type": "index",
             "_index": index_name,
@@ -26,9 +26,9 @@ def prepare_index(index_name, documents: List):
             "_source": prepare_document_for_indexing(document),
         }
         for document in documents
-    ]
-    bulk(opensearch_client(), actions)
-    opensearch_client().indices.refresh(index=index_name)
+    )
+    # Refresh as part of the bulk request so documents are searchable right away
+    bulk(opensearch_client(), actions, refresh=True)
 
 
 def get_language_value(source, language_field):
@@ -171,6 +171,10 @@ class IndexDocumentView(views.APIView):
         if has_errors:
             return Response(results, status=status.HTTP_400_BAD_REQUEST)
 
+        if not actions:
+            # Nothing to index, skip the round-trips to OpenSearch
+            return Response(results, status=status.HTTP_201_CREATED)
+
         ensure_index_exists(index_name)
         response = opensearch_client_.bulk(index=index_name, body=actions)
         for i, item in enumerate(response["items"]):
@@ -247,19 +251,20 @@ class DeleteDocumentsView(ResourceServerMixin, views.APIView):
         deletable_matches = client.search(
             index=index_name,
             body={
+                "_source": False,  # only the ids of the matching documents are needed
                 "query": self._build_query(
                     self.request.user.sub,
                     document_ids=params.document_ids,
                     tags=params.tags,
-                )
+                ),
             },
         )
-        deletable_ids = [hit["_id"] for hit in deletable_matches["hits"]["hits"]]
+        deletable_ids = {hit["_id"] for hit in deletable_matches["hits"]["hits"]}
 
         if deletable_ids:
             response = client.delete_by_query(
                 index=index_name,
-                body={"query": {"ids": {"values": deletable_ids}}},
+                body={"query": {"ids": {"values": sorted(deletable_ids)}}},
             )
             nb_deleted = response.get("deleted", 0)
         else:
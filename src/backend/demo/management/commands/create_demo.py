@@ -12,7 +12,7 @@ from django.utils import timezone
 from django.utils.text import slugify
 
 from faker import Faker
-from opensearchpy.helpers import bulk
+from opensearchpy.helpers import parallel_bulk
 
 from core import enums, factories
 from core.services.indexing import ensure_index_exists
@@ -29,6 +29,8 @@ class BulkIndexing:
     """A utility class to index to OpenSearch in bulk by just pushing to a queue."""
 
     BATCH_SIZE = 20000
+    THREAD_COUNT = 4
+    CHUNK_SIZE = 500
 
     def __init__(self, stdout, *args, **kwargs):
         """Define actions as a list."""
@@ -38,7 +40,21 @@ class BulkIndexing:
 
     def bulk_index(self):
         """Actually index documents in bulk to OpenSearch."""
-        _success, failed = bulk(opensearch_client(), self.actions, stats_only=False)
+        # Send the chunks of a batch concurrently to overlap serialization and
+        # network round-trips. Failures are collected and logged rather than raised
+        # so that one bad chunk does not abort the whole batch.
+        failed = [
+            info
+            for ok, info in parallel_bulk(
+                opensearch_client(),
+                self.actions,
+                thread_count=self.THREAD_COUNT,
+                chunk_size=self.CHUNK_SIZE,
+                raise_on_error=False,
+                raise_on_exception=False,
+            )
+            if not ok
+        ]
 
         if failed:
             self.handle_failures(failed)
@@ -155,13 +171,26 @@ def create_demo(stdout):
             ensure_index_exists(service.name)
             opensearch_client_.indices.refresh(index=service.name)
 
-    with Timeit(stdout, "Creating documents"):
-        actions = BulkIndexing(stdout)
-        for _ in range(defaults.NB_OBJECTS["documents"]):
-            service = random.choice(services)
-            document = generate_document()
-            actions.push(service.name, uuid4(), document)
-        actions.flush()
+    # Disable periodic refreshes during bulk indexing: documents are made searchable
+    # by a single refresh once they are all indexed.
+    service_indices = ",".join(service.name for service in services)
+    opensearch_client_.indices.put_settings(
+        index=service_indices, body={"index": {"refresh_interval": "-1"}}
+    )
+
+    try:
+        with Timeit(stdout, "Creating documents"):
+            actions = BulkIndexing(stdout)
+            for _ in range(defaults.NB_OBJECTS["documents"]):
+                service = random.choice(services)
+                document = generate_document()
+                actions.push(service.name, uuid4(), document)
+            actions.flush()
+    finally:
+        # Restore the default refresh interval, even if indexing failed
+        opensearch_client_.indices.put_settings(
+            index=service_indices, body={"index": {"refresh_interval": None}}
+        )
 
     with Timeit(stdout, "Creating dev services"):
         for conf in defaults.DEV_SERVICES: